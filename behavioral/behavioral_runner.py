@@ -4,53 +4,134 @@ Main behavioral risk analysis runner.
 Orchestrates text loading, processing, scoring, and optional LLM analysis.
 Outputs JSON profile conforming to schema.
 """
+import os
 import sys
+import time
+import hashlib
 import argparse
+from multiprocessing import Pool
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List
-
-from utils import load_text_files, save_json, get_logger, KEYWORD_CATEGORIES
-from text_processing import (
-    load_all_text_files,
-    tokenize,
-    count_keywords,
-    compute_basic_stats,
-    sentiment_score,
-    extract_named_entities,
-)
-from scoring import compute_all_scores, map_risk_label
-from schema import BehavioralProfile, Metadata, QuantitativeMetrics, QualitativeProfile, Recommendations
-from llm_client import call_llm, prepare_llm_prompt, LLM_ENABLED
+from typing import Dict, List, Optional, Tuple
+
+# Relative imports when loaded as the behavioral package; flat imports
+# when run directly from this directory (CLI, tests)
+try:
+    from .utils import load_text_files, load_json, save_json, get_logger, KEYWORD_CATEGORIES
+    from .text_processing import load_all_text_files, analyze_text, estimate_sentence_count
+    from .scoring import compute_all_scores, map_risk_label
+    from .schema import BehavioralProfile, Metadata, QuantitativeMetrics, QualitativeProfile, Recommendations
+    from .llm_client import call_llm, prepare_llm_prompt, LLM_ENABLED
+except ImportError:
+    from utils import load_text_files, load_json, save_json, get_logger, KEYWORD_CATEGORIES
+    from text_processing import load_all_text_files, analyze_text, estimate_sentence_count
+    from scoring import compute_all_scores, map_risk_label
+    from schema import BehavioralProfile, Metadata, QuantitativeMetrics, QualitativeProfile, Recommendations
+    from llm_client import call_llm, prepare_llm_prompt, LLM_ENABLED
 
 logger = get_logger(__name__)
 
 
+def _load_quant_cache(cache_path: Path, corpus_hash: str) -> Optional[Dict]:
+    """
+    Load cached quantitative metrics if they match the corpus hash.
+
+    Args:
+        cache_path: Path to the cache file
+        corpus_hash: Hash of the current corpus text
+
+    Returns:
+        Cached metrics dict, or None on miss/stale/corrupt cache
+    """
+    if not cache_path.exists():
+        return None
+    try:
+        cached = load_json(cache_path)
+    except Exception:
+        return None
+    if cached.get("corpus_hash") != corpus_hash:
+        return None
+    return cached
+
+
+def _save_quant_cache(
+    cache_path: Path,
+    corpus_hash: str,
+    word_count: int,
+    sentence_count: int,
+    keyword_counts: Dict[str, int],
+    sentiment: float,
+) -> None:
+    """Persist quantitative metrics keyed on the corpus hash (best effort)."""
+    try:
+        save_json(
+            {
+                "corpus_hash": corpus_hash,
+                "word_count": word_count,
+                "sentence_count": sentence_count,
+                "keyword_counts": keyword_counts,
+                "sentiment": sentiment,
+            },
+            str(cache_path),
+        )
+    except Exception as e:
+        logger.warning(f"Could not write quantitative cache: {e}")
+
+
+def _analyze_file(path: str) -> Tuple[int, int, Dict[str, int], float]:
+    """
+    Compute quantitative partials for a single file (runs in a worker process).
+
+    Module-level so it can be pickled by multiprocessing. Unreadable
+    files are skipped with a zero partial, matching iter_text_files'
+    skip semantics so both analysis paths count the same corpus.
+
+    Args:
+        path: Path to a .txt file
+
+    Returns:
+        (word_count, raw_sentence_count, keyword_counts, sentiment) tuple
+    """
+    try:
+        text = Path(path).read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error(f"Failed to load {Path(path).name}: {e}")
+        return 0, 0, {}, 0.5
+
+    stats = analyze_text(text)
+    return stats.word_count, stats.raw_sentence_count, stats.keyword_counts, stats.sentiment
+
+
 def run_analysis(
     input_dir: str = "behavioral_data",
     output_file: str = "output/behavioral_profile.json",
     llm_enabled: bool = False,
+    n_workers: Optional[int] = None,
+    stage_timings: Optional[Dict[str, float]] = None,
 ) -> BehavioralProfile:
     """
     Main analysis pipeline.
-    
+
     Steps:
     1. Load all text files from input_dir
-    2. Compute quantitative metrics
+    2. Compute quantitative metrics (parallelized per file when possible)
     3. Compute scores
     4. Optionally call LLM for qualitative analysis
     5. Merge and save to output_file
-    
+
     Args:
         input_dir: Directory with text files
         output_file: Path to output JSON
         llm_enabled: Whether to enable LLM analysis
-    
+        n_workers: Worker processes for per-file analysis (default: cpu count)
+        stage_timings: Optional dict populated in place with per-stage
+            wall-clock seconds, for callers that surface timing telemetry
+
     Returns:
         BehavioralProfile instance
     """
     logger.info(f"Starting behavioral analysis on {input_dir}")
-    
+    t_start = time.perf_counter()
+
     # Step 1: Load text
     logger.info("Step 1: Loading text files...")
     text = load_all_text_files(input_dir)
@@ -64,21 +145,70 @@ def run_analysis(
     source_files = [f.name for f in sorted(input_path.glob("*.txt"))]
     logger.info(f"Loaded {len(source_files)} files: {source_files}")
     
+    t_loaded = time.perf_counter()
+
     # Step 2: Compute quantitative metrics
     logger.info("Step 2: Computing quantitative metrics...")
-    tokens = tokenize(text)
-    word_count = len(tokens)
-    
-    basic_stats = compute_basic_stats(text)
-    sentence_count = basic_stats["sentence_count"]
-    
-    keyword_counts = count_keywords(text, KEYWORD_CATEGORIES)
-    sentiment = sentiment_score(text)
+    # Key the cache on the corpus and the (editable) keyword lists, so
+    # changing KEYWORD_CATEGORIES invalidates cached counts
+    hasher = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    hasher.update(repr(sorted(KEYWORD_CATEGORIES.items())).encode("utf-8"))
+    corpus_hash = hasher.hexdigest()
+    cache_path = Path(output_file).parent / ".quant_cache.json"
+
+    cached = _load_quant_cache(cache_path, corpus_hash)
+    if cached is not None:
+        # Common re-run flow (e.g. after adding output/llm_qualitative.json):
+        # the corpus is unchanged, so skip all tokenization/counting work.
+        logger.info("Corpus unchanged; reusing cached quantitative metrics")
+        word_count = cached["word_count"]
+        sentence_count = cached["sentence_count"]
+        keyword_counts = cached["keyword_counts"]
+        sentiment = cached["sentiment"]
+    else:
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        txt_paths = [str(input_path / name) for name in source_files]
+        # Worker startup costs more than it saves on tiny corpora
+        if n_workers > 1 and len(txt_paths) >= 3:
+            # Per-file metrics are independent; map across workers, then
+            # reduce by summing counts and word-count-weighting sentiment.
+            with Pool(min(n_workers, len(txt_paths))) as pool:
+                partials = pool.map(_analyze_file, txt_paths)
+
+            word_count = sum(p[0] for p in partials)
+            # Transcript heuristic on the summed raw counts, not per
+            # file, so this path agrees with the serial whole-corpus one
+            sentence_count = estimate_sentence_count(
+                word_count, sum(p[1] for p in partials)
+            )
+            keyword_counts = {cat: 0 for cat in KEYWORD_CATEGORIES}
+            for _, _, counts, _ in partials:
+                for cat, count in counts.items():
+                    keyword_counts[cat] = keyword_counts.get(cat, 0) + count
+
+            if word_count > 0:
+                sentiment = sum(p[3] * p[0] for p in partials) / word_count
+            else:
+                sentiment = 0.5
+        else:
+            stats = analyze_text(text)
+            word_count = stats.word_count
+            sentence_count = stats.sentence_count
+            keyword_counts = stats.keyword_counts
+            sentiment = stats.sentiment
+
+        _save_quant_cache(
+            cache_path, corpus_hash, word_count, sentence_count, keyword_counts, sentiment
+        )
     
     logger.info(f"Text stats - Words: {word_count}, Sentences: {sentence_count}")
     logger.info(f"Keyword counts: {keyword_counts}")
     logger.info(f"Sentiment: {sentiment:.3f}")
     
+    t_quant = time.perf_counter()
+
     # Step 3: Compute scores
     logger.info("Step 3: Computing scores...")
     scores = compute_all_scores(keyword_counts, word_count, sentiment)
@@ -88,6 +218,8 @@ def run_analysis(
     logger.info(f"Scores computed: {scores}")
     logger.info(f"Risk tolerance: {risk_label} ({risk_score:.3f})")
     
+    t_scored = time.perf_counter()
+
     # Step 4: Optional LLM analysis
     logger.info("Step 4: Qualitative analysis (LLM)...")
     llm_used = False
@@ -108,9 +240,7 @@ def run_analysis(
     if manual_llm_path.exists():
         try:
             logger.info("Found manual LLM file at output/llm_qualitative.json")
-            import json
-            with open(manual_llm_path, 'r') as f:
-                llm_response = json.load(f)
+            llm_response = load_json(manual_llm_path)
             
             qualitative_data.update({
                 "risk_tolerance_label": llm_response.get("risk_tolerance_label", risk_label),
@@ -166,6 +296,8 @@ def run_analysis(
             "then save response as output/llm_qualitative.json and re-run."
         )
     
+    t_qualitative = time.perf_counter()
+
     # Step 5: Assemble profile
     logger.info("Step 5: Assembling final profile...")
     
@@ -176,7 +308,7 @@ def run_analysis(
     
     profile = BehavioralProfile(
         metadata=Metadata(
-            created_at=datetime.utcnow().isoformat() + "Z",
+            created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             source_files=source_files,
             llm_used=llm_used,
         ),
@@ -205,7 +337,18 @@ def run_analysis(
     logger.info(f"Step 6: Saving to {output_file}...")
     save_json(profile.to_dict(), output_file)
     logger.info(f"Analysis complete. Output saved to {output_file}")
-    
+
+    if stage_timings is not None:
+        t_saved = time.perf_counter()
+        stage_timings.update({
+            "load_text": t_loaded - t_start,
+            "quantitative": t_quant - t_loaded,
+            "scoring": t_scored - t_quant,
+            "qualitative": t_qualitative - t_scored,
+            "assemble_save": t_saved - t_qualitative,
+            "total": t_saved - t_start,
+        })
+
     return profile
 
 
@@ -2,14 +2,47 @@
 LLM client: encapsulate LLM calls with safe, isolated interface.
 """
 import os
+import re
 import json
-from typing import Dict, Optional
-from utils import logger
+from typing import Dict, List, Optional
+try:
+    from .utils import logger, json_loads
+except ImportError:
+    from utils import logger, json_loads
+
+# Extracts the JSON payload from an LLM response: either the body of a
+# ```json / ``` fenced block, or the outermost bare {...} object.
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# Escapes quotes and flattens newlines for prompt embedding in one pass
+_PROMPT_TRANS = str.maketrans({'"': '\\"', '\n': ' '})
 
 
 # Global flag to enable/disable LLM calls
 LLM_ENABLED = os.environ.get("LLM_ENABLED", "False").lower() in ("true", "1", "yes")
 
+# Shared HTTP session (created lazily) so repeat LLM calls reuse the
+# TCP+TLS connection instead of handshaking per request.
+_SESSION = None
+
+
+def _get_session():
+    """Create the pooled requests session once and reuse it."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5),
+        )
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
 
 def call_llm(
     prompt: str,
@@ -42,6 +75,8 @@ def call_llm(
     except ImportError:
         logger.error("requests library not found. Install with: pip install requests")
         return _get_stub_response()
+
+    session = _get_session()
     
     # Call OpenAI API
     headers = {
@@ -60,7 +95,7 @@ def call_llm(
     }
     
     try:
-        response = requests.post(
+        response = session.post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=payload,
@@ -84,6 +119,47 @@ def call_llm(
         return _get_stub_response()
 
 
+def call_llm_batch(
+    prompts: List[str],
+    api_key_env: str = "LLM_API_KEY",
+    model: str = "gpt-3.5-turbo",
+    max_tokens: int = 1500,
+    max_concurrency: int = 4,
+) -> List[Dict]:
+    """
+    Call the LLM for several prompts concurrently.
+
+    Requests are issued over the shared pooled session from worker
+    threads, so the per-call TLS/HTTP latency is paid once and overlapped
+    across prompts instead of serialized.
+
+    Args:
+        prompts: List of user prompts
+        api_key_env: Environment variable name for API key
+        model: Model name (e.g., "gpt-3.5-turbo", "gpt-4")
+        max_tokens: Max tokens per response
+        max_concurrency: Max in-flight requests
+
+    Returns:
+        List of parsed responses, in prompt order
+    """
+    if not prompts:
+        return []
+    if len(prompts) == 1:
+        return [call_llm(prompts[0], api_key_env, model, max_tokens)]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    logger.info(f"Dispatching {len(prompts)} LLM prompts concurrently")
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as executor:
+        return list(
+            executor.map(
+                lambda p: call_llm(p, api_key_env, model, max_tokens),
+                prompts,
+            )
+        )
+
+
 def _parse_json_response(content: str) -> Dict:
     """
     Robustly parse JSON from LLM response.
@@ -98,39 +174,18 @@ def _parse_json_response(content: str) -> Dict:
     """
     # Try direct JSON parse first
     try:
-        return json.loads(content)
+        return json_loads(content)
     except json.JSONDecodeError:
         pass
-    
-    # Try to extract JSON from markdown code block
-    if "```json" in content:
-        start = content.find("```json") + 7
-        end = content.find("```", start)
-        if end > start:
-            try:
-                return json.loads(content[start:end].strip())
-            except json.JSONDecodeError:
-                pass
-    
-    # Try to extract JSON from generic code block
-    if "```" in content:
-        start = content.find("```") + 3
-        end = content.find("```", start)
-        if end > start:
-            try:
-                return json.loads(content[start:end].strip())
-            except json.JSONDecodeError:
-                pass
-    
-    # Last resort: look for JSON object pattern
-    import re
-    match = re.search(r'\{[\s\S]*\}', content)
+
+    # One precompiled scan: fenced ```json/``` block, else a bare JSON object
+    match = _JSON_BLOCK.search(content)
     if match:
         try:
-            return json.loads(match.group())
+            return json_loads((match.group(1) or match.group(2)).strip())
         except json.JSONDecodeError:
             pass
-    
+
     logger.warning("Could not parse JSON from LLM response. Returning stub.")
     return _get_stub_response()
 
@@ -175,7 +230,7 @@ LLM_USER_PROMPT_TEMPLATE = (
     "- biases: List of identified cognitive biases (max 5)\n"
     "- narrative: Concise analysis (max 300 words)\n"
     "- recommendations: Object with portfolio_modifier (string), sector_pref (list of sectors), notes (string)\n"
-    "- evidence: Array of {claim, support} objects for key assertions\n\n"
+    "- evidence: Array of {{claim, support}} objects for key assertions\n\n"
     "Respond with JSON ONLY, no markdown, no code blocks."
 )
 
@@ -194,12 +249,15 @@ def prepare_llm_prompt(text: str, max_tokens: int = 5000) -> str:
         Formatted prompt
     """
     char_limit = max_tokens * 4
-    if len(text) > char_limit:
-        text = text[:char_limit] + "\n[...truncated...]"
+    truncated = len(text) > char_limit
+    if truncated:
+        text = text[:char_limit]
         logger.info(f"Trimmed text to ~{max_tokens} tokens")
-    
-    # Escape quotes to avoid breaking JSON
-    text = text.replace('"', '\\"').replace('\n', ' ')
-    
+
+    # Escape quotes / flatten newlines in one pass over the trimmed slice
+    text = text.translate(_PROMPT_TRANS)
+    if truncated:
+        text += " [...truncated...]"
+
     prompt = LLM_USER_PROMPT_TEMPLATE.format(corpus=text)
     return prompt
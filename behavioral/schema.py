@@ -1,12 +1,22 @@
 """
 JSON schema and dataclass definitions for behavioral profiles.
 """
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional
-from datetime import datetime
 
 
-@dataclass
+def _shallow_dict(obj) -> Dict:
+    """
+    Build a field dict without dataclasses.asdict's recursive deepcopy.
+
+    The schema fields are plain containers already, so a shallow copy of
+    each dataclass's fields is enough for JSON serialization.
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+@dataclass(slots=True, frozen=True)
 class Metadata:
     """Metadata for the behavioral profile."""
     created_at: str
@@ -14,7 +24,7 @@ class Metadata:
     llm_used: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuantitativeMetrics:
     """Quantitative metrics from text analysis."""
     word_count: int
@@ -25,7 +35,7 @@ class QuantitativeMetrics:
     scores: Dict[str, float]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualitativeProfile:
     """Qualitative profile from LLM analysis."""
     risk_tolerance_label: str
@@ -34,7 +44,7 @@ class QualitativeProfile:
     narrative: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recommendations:
     """Recommendations based on analysis."""
     portfolio_modifier: str
@@ -42,7 +52,7 @@ class Recommendations:
     notes: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BehavioralProfile:
     """Complete behavioral profile."""
     metadata: Metadata
@@ -53,10 +63,10 @@ class BehavioralProfile:
     def to_dict(self) -> Dict:
         """Convert to dictionary (for JSON serialization)."""
         return {
-            "metadata": asdict(self.metadata),
-            "quantitative": asdict(self.quantitative),
-            "qualitative": asdict(self.qualitative),
-            "recommendations": asdict(self.recommendations),
+            "metadata": _shallow_dict(self.metadata),
+            "quantitative": _shallow_dict(self.quantitative),
+            "qualitative": _shallow_dict(self.qualitative),
+            "recommendations": _shallow_dict(self.recommendations),
         }
     
     @classmethod
@@ -99,7 +109,7 @@ def create_stub_profile(
     
     profile = BehavioralProfile(
         metadata=Metadata(
-            created_at=datetime.utcnow().isoformat() + "Z",
+            created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             source_files=source_files,
             llm_used=False,
         ),
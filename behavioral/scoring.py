@@ -1,8 +1,49 @@
 """
 Scoring: compute normalized quantitative scores (0-1 or 0-100).
 """
+import logging
+from bisect import bisect_right
 from typing import Dict
-from utils import logger
+
+import numpy as np
+
+try:
+    from .utils import logger
+except ImportError:
+    from utils import logger
+
+# Per-category rate thresholds (mentions per 1000 words that map to score 1.0).
+# These are editable weights; lower threshold = higher score for the same rate.
+_THRESHOLDS = {
+    "growth": 0.3,      # up to 0.3 mentions per 1000 words = score 1.0 (extremely sensitive)
+    "safety": 3.0,      # up to 3 mentions per 1000 words = score 1.0
+    "momentum": 0.10,   # up to 0.10 mentions per 1000 words = score 1.0 (very sensitive)
+    "volatility": 0.2,  # up to 0.2 mentions per 1000 words = score 1.0 (extremely sensitive)
+    "emotional": 3.0,   # up to 3 mentions per 1000 words = score 1.0 (more sensitive)
+}
+_DEFAULT_THRESHOLD = 5.0
+
+# Fixed category order for array-shaped (batched) scoring
+_CATEGORIES = ("growth", "safety", "momentum", "volatility", "emotional")
+_THRESHOLD_VEC = np.array([_THRESHOLDS[cat] for cat in _CATEGORIES])
+
+# Default risk weights (growth, momentum, sentiment, safety) + baseline,
+# matching compute_risk_tolerance_score's defaults
+_RISK_WEIGHT_VEC = np.array([0.45, 0.40, 0.30, -0.18])
+_RISK_BASELINE = 0.30
+
+# Risk label lookup table: score s maps to _RISK_LABELS[i] where
+# _RISK_BOUNDS[i-1] <= s < _RISK_BOUNDS[i]
+_RISK_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+_RISK_LABELS = (
+    "Conservative",
+    "Moderately Conservative",
+    "Moderate",
+    "Moderately Aggressive",
+    "Aggressive",
+)
+_RISK_BOUNDS_ARR = np.array(_RISK_BOUNDS)
+_RISK_LABELS_ARR = np.array(_RISK_LABELS)
 
 
 def normalize(value: float, min_val: float, max_val: float, invert: bool = False) -> float:
@@ -41,36 +82,24 @@ def compute_keyword_scores(keyword_counts: Dict[str, int], word_count: int) -> D
     Returns:
         Dict mapping category -> score (0-1)
     """
-    scores = {}
-    
     if word_count == 0:
-        for category in keyword_counts:
-            scores[category] = 0.0
-        return scores
-    
-    # Normalize to mentions per 1000 words
-    rate_per_1000 = {
-        cat: (count / word_count * 1000) if word_count > 0 else 0
-        for cat, count in keyword_counts.items()
-    }
-    
-    # Define thresholds for each category (these are editable weights)
-    # Lower thresholds = higher scores for the same mention counts
-    thresholds = {
-        "growth": 0.3,      # up to 0.3 mentions per 1000 words = score 1.0 (extremely sensitive)
-        "safety": 3.0,      # up to 3 mentions per 1000 words = score 1.0
-        "momentum": 0.10,   # up to 0.10 mentions per 1000 words = score 1.0 (very sensitive)
-        "volatility": 0.2,  # up to 0.2 mentions per 1000 words = score 1.0 (extremely sensitive)
-        "emotional": 3.0,   # up to 3 mentions per 1000 words = score 1.0 (more sensitive)
-    }
-    
-    for category, rate in rate_per_1000.items():
-        threshold = thresholds.get(category, 5.0)
-        score = normalize(rate, 0, threshold)
-        scores[category] = score
-    
-    logger.info(f"Keyword rates per 1000: {rate_per_1000}")
-    logger.info(f"Keyword scores: {scores}")
+        return {category: 0.0 for category in keyword_counts}
+
+    categories = list(keyword_counts)
+    counts = np.array([keyword_counts[cat] for cat in categories], dtype=np.float64)
+    thresholds = np.array(
+        [_THRESHOLDS.get(cat, _DEFAULT_THRESHOLD) for cat in categories]
+    )
+
+    # Normalize to mentions per 1000 words, then clamp rate/threshold to 0-1
+    rates = counts * (1000.0 / word_count)
+    score_vec = np.clip(rates / thresholds, 0.0, 1.0)
+    scores = dict(zip(categories, score_vec.tolist()))
+
+    # Guarded: stringifying the rate dict is wasted work when discarded
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Keyword rates per 1000: %s", dict(zip(categories, rates.tolist())))
+        logger.debug("Keyword scores: %s", scores)
     return scores
 
 
@@ -107,25 +136,26 @@ def compute_risk_tolerance_score(
     
     keyword_scores = quant_metrics.get("keyword_scores", {})
     sentiment = quant_metrics.get("sentiment", 0.5)
-    
-    growth_focus = keyword_scores.get("growth", 0.0)
-    momentum_bias = keyword_scores.get("momentum", 0.0)
-    safety_focus = keyword_scores.get("safety", 0.0)
-    volatility_tolerance = keyword_scores.get("volatility", 0.0)
-    
-    # Compute weighted sum with baseline boost
-    score = (
-        weights.get("growth", 0.4) * growth_focus
-        + weights.get("momentum", 0.35) * momentum_bias
-        + weights.get("sentiment", 0.25) * sentiment
-        + weights.get("safety", -0.15) * safety_focus
-        + weights.get("baseline", 0.15)  # Baseline shift toward aggressive
-    )
-    
+
+    # Weighted sum with baseline boost as a single dot product
+    features = np.array([
+        keyword_scores.get("growth", 0.0),
+        keyword_scores.get("momentum", 0.0),
+        sentiment,
+        keyword_scores.get("safety", 0.0),
+    ])
+    weight_vec = np.array([
+        weights.get("growth", 0.4),
+        weights.get("momentum", 0.35),
+        weights.get("sentiment", 0.25),
+        weights.get("safety", -0.15),
+    ])
+    score = weight_vec @ features + weights.get("baseline", 0.15)
+
     # Clamp to 0-1
-    score = max(0.0, min(1.0, score))
-    
-    logger.info(f"Risk tolerance score: {score:.3f}")
+    score = float(np.clip(score, 0.0, 1.0))
+
+    logger.debug("Risk tolerance score: %.3f", score)
     return score
 
 
@@ -139,16 +169,62 @@ def map_risk_label(score: float) -> str:
     Returns:
         Risk tolerance label
     """
-    if score < 0.2:
-        return "Conservative"
-    elif score < 0.4:
-        return "Moderately Conservative"
-    elif score < 0.6:
-        return "Moderate"
-    elif score < 0.8:
-        return "Moderately Aggressive"
-    else:
-        return "Aggressive"
+    return _RISK_LABELS[bisect_right(_RISK_BOUNDS, score)]
+
+
+def map_risk_labels(scores: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized map_risk_label for an array of scores.
+
+    Args:
+        scores: Array of risk tolerance scores 0-1
+
+    Returns:
+        Array of risk tolerance labels
+    """
+    indexes = np.searchsorted(_RISK_BOUNDS_ARR, np.asarray(scores), side="right")
+    return _RISK_LABELS_ARR[indexes]
+
+
+def compute_all_scores_batch(
+    counts: "np.ndarray",
+    word_counts: "np.ndarray",
+    sentiments: "np.ndarray",
+) -> "np.ndarray":
+    """
+    Vectorized scoring for a batch of documents.
+
+    Args:
+        counts: (N, 5) keyword counts in _CATEGORIES order
+        word_counts: (N,) total word counts
+        sentiments: (N,) sentiment scores 0-1
+
+    Returns:
+        (N, 6) array of scores: the five keyword-category scores in
+        _CATEGORIES order, then risk_tolerance
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    word_counts = np.asarray(word_counts, dtype=np.float64)
+    sentiments = np.asarray(sentiments, dtype=np.float64)
+
+    # Mentions per 1000 words, clamped against the per-category thresholds.
+    # Documents with zero words score 0.0 across the board.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(
+            word_counts[:, None] > 0, counts * 1000.0 / word_counts[:, None], 0.0
+        )
+    keyword_scores = np.clip(rates / _THRESHOLD_VEC, 0.0, 1.0)
+
+    # growth, momentum, sentiment, safety features per document
+    features = np.column_stack([
+        keyword_scores[:, 0],
+        keyword_scores[:, 2],
+        sentiments,
+        keyword_scores[:, 1],
+    ])
+    risk = np.clip(features @ _RISK_WEIGHT_VEC + _RISK_BASELINE, 0.0, 1.0)
+
+    return np.column_stack([keyword_scores, risk])
 
 
 def compute_all_scores(
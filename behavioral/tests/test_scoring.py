@@ -13,6 +13,8 @@ from scoring import (
     compute_risk_tolerance_score,
     map_risk_label,
     compute_all_scores,
+    compute_all_scores_batch,
+    _CATEGORIES,
 )
 
 
@@ -115,6 +117,44 @@ def test_compute_all_scores():
     print("✓ test_compute_all_scores passed")
 
 
+def test_compute_all_scores_batch():
+    """Test batched scoring matches the scalar path."""
+    keyword_counts = {
+        "growth": 15,
+        "safety": 5,
+        "momentum": 2,
+        "volatility": 8,
+        "emotional": 10,
+    }
+    word_count = 2000
+    sentiment = 0.6
+
+    scalar = compute_all_scores(keyword_counts, word_count, sentiment)
+    batch = compute_all_scores_batch(
+        [[keyword_counts[cat] for cat in _CATEGORIES]],
+        [word_count],
+        [sentiment],
+    )
+
+    assert batch.shape == (1, 6)
+    for i, cat in enumerate(_CATEGORIES):
+        key = {
+            "growth": "growth_focus",
+            "safety": "safety_focus",
+            "momentum": "momentum_bias",
+            "volatility": "volatility_tolerance",
+            "emotional": "emotional_intensity",
+        }[cat]
+        assert abs(batch[0, i] - scalar[key]) < 1e-9
+    assert abs(batch[0, 5] - scalar["risk_tolerance"]) < 1e-9
+
+    # Zero-word documents score 0.0 across the keyword columns
+    empty = compute_all_scores_batch([[0, 0, 0, 0, 0]], [0], [0.5])
+    assert (empty[0, :5] == 0.0).all()
+
+    print("✓ test_compute_all_scores_batch passed")
+
+
 def run_all_tests():
     """Run all tests."""
     print("Running scoring tests...\n")
@@ -124,7 +164,8 @@ def run_all_tests():
     test_compute_risk_tolerance_score()
     test_map_risk_label()
     test_compute_all_scores()
-    
+    test_compute_all_scores_batch()
+
     print("\n✅ All scoring tests passed!")
 
 
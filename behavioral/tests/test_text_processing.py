@@ -13,6 +13,7 @@ from text_processing import (
     compute_basic_stats,
     sentiment_score,
     extract_named_entities,
+    analyze_text,
 )
 
 
@@ -74,6 +75,23 @@ def test_sentiment_score():
     print("✓ test_sentiment_score passed")
 
 
+def test_analyze_text():
+    """Test the fused single-call analysis."""
+    text = "Growth is great. We want rapid growth! Stable income matters too."
+    keywords = {
+        "growth": ["growth", "expansion"],
+        "safety": ["stable", "income"],
+    }
+
+    stats = analyze_text(text, keywords)
+
+    assert stats.word_count == compute_basic_stats(text)["word_count"]
+    assert stats.sentence_count >= 3
+    assert stats.keyword_counts == count_keywords(text, keywords)
+    assert 0 <= stats.sentiment <= 1
+    print("✓ test_analyze_text passed")
+
+
 def test_extract_named_entities():
     """Test named entity extraction."""
     text = "John Smith works at Apple Inc. Sarah Johnson joined Google last year."
@@ -94,6 +112,7 @@ def run_all_tests():
     test_count_keywords()
     test_compute_basic_stats()
     test_sentiment_score()
+    test_analyze_text()
     test_extract_named_entities()
     
     print("\n✅ All tests passed!")
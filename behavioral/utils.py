@@ -2,14 +2,22 @@
 Utility functions: file loading, logging, keyword definitions.
 """
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple, Union
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging (skip if the host app already set up handlers,
+# e.g. Streamlit re-imports this module on script reruns)
+if not logging.root.handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 logger = logging.getLogger(__name__)
 
 # Default keyword categories for behavioral analysis
@@ -77,58 +85,109 @@ KEYWORD_CATEGORIES = {
 }
 
 
-def load_text_files(directory: str) -> str:
+def iter_text_files(directory: str) -> Iterator[Tuple[str, str]]:
     """
-    Load all .txt files from a directory and concatenate them.
-    
+    Stream (filename, content) pairs for each .txt file in a directory.
+
+    Files are yielded one at a time so callers can process them
+    incrementally instead of holding every file in memory at once.
+
     Args:
         directory: Path to directory containing .txt files
-    
-    Returns:
-        Concatenated string of all text file contents
+
+    Yields:
+        (filename, content) tuples in sorted filename order
     """
     path = Path(directory)
     if not path.exists():
-        logger.warning(f"Directory {directory} does not exist. Returning empty string.")
-        return ""
-    
-    all_text = []
-    txt_files = list(path.glob("*.txt"))
-    
+        logger.warning(f"Directory {directory} does not exist. Nothing to load.")
+        return
+
+    # os.scandir lists a flat directory faster than glob (no pattern
+    # engine); skip dot-prefixed names to match glob("*.txt") and the
+    # other listings keyed off it
+    with os.scandir(path) as it:
+        txt_files = sorted(
+            (path / entry.name for entry in it
+             if entry.is_file()
+             and entry.name.endswith(".txt")
+             and not entry.name.startswith(".")),
+        )
     if not txt_files:
         logger.warning(f"No .txt files found in {directory}")
-        return ""
-    
-    for txt_file in sorted(txt_files):
+        return
+
+    for txt_file in txt_files:
         try:
-            with open(txt_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                all_text.append(content)
-                logger.info(f"Loaded {txt_file.name} ({len(content)} chars)")
+            # One raw read + one decode per file; skips the buffered
+            # text-wrapper's incremental decoding layer.
+            content = txt_file.read_bytes().decode("utf-8")
+            logger.info(f"Loaded {txt_file.name} ({len(content)} chars)")
+            yield txt_file.name, content
         except Exception as e:
             logger.error(f"Failed to load {txt_file.name}: {e}")
-    
-    result = "\n".join(all_text)
-    logger.info(f"Total text loaded: {len(result)} characters from {len(txt_files)} files")
+
+
+def load_text_files(directory: str) -> str:
+    """
+    Load all .txt files from a directory and concatenate them.
+
+    Args:
+        directory: Path to directory containing .txt files
+
+    Returns:
+        Concatenated string of all text file contents
+    """
+    result = "\n".join(content for _, content in iter_text_files(directory))
+    logger.info(f"Total text loaded: {len(result)} characters from {directory}")
     return result
 
 
+def json_loads(payload: Union[str, bytes]) -> dict:
+    """
+    Parse JSON using orjson when available, stdlib json otherwise.
+
+    Args:
+        payload: JSON text or bytes
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    import json
+    return json.loads(payload)
+
+
+def json_dumps_bytes(data: dict) -> bytes:
+    """
+    Serialize to pretty-printed JSON bytes (orjson if available).
+
+    Args:
+        data: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON with 2-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    import json
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def save_json(data: dict, filepath: str) -> None:
     """
     Save a dictionary as JSON with pretty formatting.
-    
+
     Args:
         data: Dictionary to save
         filepath: Path to output JSON file
     """
-    import json
-    
     output_path = Path(filepath)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        output_path.write_bytes(json_dumps_bytes(data))
         logger.info(f"Saved JSON to {filepath}")
     except Exception as e:
         logger.error(f"Failed to save JSON to {filepath}: {e}")
@@ -138,18 +197,15 @@ def save_json(data: dict, filepath: str) -> None:
 def load_json(filepath: str) -> dict:
     """
     Load JSON from file.
-    
+
     Args:
         filepath: Path to JSON file
-    
+
     Returns:
         Loaded dictionary
     """
-    import json
-    
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_loads(Path(filepath).read_bytes())
     except Exception as e:
         logger.error(f"Failed to load JSON from {filepath}: {e}")
         raise
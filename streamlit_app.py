@@ -6,13 +6,258 @@ Simple interface to load local files, run analysis, and download results.
 import streamlit as st
 import json
 from pathlib import Path
-import sys
-
-# Add behavioral module to path
-sys.path.insert(0, str(Path(__file__).parent / "behavioral"))
 
 from behavioral.behavioral_runner import run_analysis
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_payload(data: dict) -> bytes:
+    """Compact JSON bytes for downloads (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _corpus_payload(input_dir: str) -> str:
+    """
+    Concatenated corpus for download, read strictly.
+
+    Unlike load_text_files (which logs and skips unreadable files),
+    this raises on the first bad file so Streamlit surfaces the error
+    on click instead of silently serving a truncated corpus.
+    """
+    return "\n".join(
+        p.read_bytes().decode("utf-8")
+        for p in sorted(Path(input_dir).glob("*.txt"))
+    )
+
+
+# Static sidebar help, built once at import instead of per rerun
+HELP_MD = """
+**About LLM Analysis:**
+
+LLM (AI) analysis is disabled to avoid costs. For qualitative insights:
+
+1. Run the analysis to get quantitative metrics
+2. Download the raw text corpus from the Results section
+3. Copy the text and use ChatGPT/Gemini with this prompt:
+
+```
+Analyze this investment psychology corpus and provide:
+
+1. Risk Tolerance Label: [Conservative/Moderately Conservative/Moderate/Moderately Aggressive/Aggressive]
+2. Personality Traits: [list 3-5 traits]
+3. Behavioral Biases: [list 2-4 biases]
+4. Narrative: [2-3 paragraph analysis]
+5. Portfolio Recommendations: [sectors, allocation advice]
+
+Format response as JSON matching this structure:
+{
+  "risk_tolerance_label": "...",
+  "traits": [...],
+  "biases": [...],
+  "narrative": "...",
+  "recommendations": {
+    "portfolio_modifier": "...",
+    "sector_pref": [...],
+    "notes": "..."
+  }
+}
+```
+
+4. Paste the LLM's JSON response into `output/llm_qualitative.json`
+5. Re-run analysis to merge results
+"""
+
+# st.fragment isolates the static help from full-page reruns
+# (no-op passthrough on Streamlit versions without fragments)
+_fragment = getattr(st, "fragment", lambda f: f)
+
+
+@_fragment
+def _sidebar_help() -> None:
+    """Render the static LLM-workflow help text."""
+    st.markdown(HELP_MD)
+
+
+def _corpus_signature(input_dir: str) -> tuple:
+    """
+    Fingerprint of the analysis inputs: every .txt file's (name, size,
+    mtime) plus the optional manual LLM file. Used as a cache key so
+    reruns recompute only when an input actually changed.
+    """
+    sig = sorted(
+        (p.name, p.stat().st_size, p.stat().st_mtime_ns)
+        for p in Path(input_dir).glob("*.txt")
+    )
+    manual_llm = Path("output/llm_qualitative.json")
+    if manual_llm.exists():
+        sig.append((manual_llm.name, manual_llm.stat().st_size, manual_llm.stat().st_mtime_ns))
+    return tuple(sig)
+
+
+@st.cache_data(ttl="10s")
+def _list_txt_files(input_dir: str) -> list:
+    """Sorted .txt filenames, cached briefly to avoid re-stat on every rerun."""
+    return sorted(p.name for p in Path(input_dir).glob("*.txt"))
+
+
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def _cached_run_analysis(corpus_sig: tuple, input_dir: str, output_file: str, llm_enabled: bool):
+    """run_analysis memoized on the corpus signature across script reruns.
+
+    Returns (profile, stage_timings) so cached hits keep the timing
+    telemetry from the run that produced them.
+    """
+    stage_timings = {}
+    profile = run_analysis(
+        input_dir=input_dir,
+        output_file=output_file,
+        llm_enabled=llm_enabled,
+        stage_timings=stage_timings,
+    )
+    return profile, stage_timings
+
+
+def render_results(profile) -> None:
+    """
+    Render the results sections for a completed analysis.
+
+    Lives outside the run-button branch so results rendered from
+    session state survive script reruns (expander toggles, downloads).
+    """
+    st.subheader("📊 Results Summary")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            "Words Analyzed",
+            f"{profile.quantitative.word_count:,}",
+            help="Total words processed from all input files"
+        )
+    with col2:
+        st.metric(
+            "Sentiment Score",
+            f"{profile.quantitative.sentiment:.2f}",
+            help="Overall sentiment: 0=negative, 0.5=neutral, 1=positive. Measures optimism vs pessimism in language."
+        )
+    with col3:
+        st.metric(
+            "Risk Tolerance",
+            st.session_state["risk_label_display"],
+            help="Investment risk profile based on behavioral patterns: Conservative → Moderate → Aggressive"
+        )
+
+    st.divider()
+
+    # Detailed metrics: one dataframe element instead of a metric grid
+    st.subheader("📈 Behavioral Scores")
+    scores = profile.quantitative.scores
+    score_rows = {
+        "Growth Focus": "Preference for high-growth opportunities and scaling businesses",
+        "Momentum Bias": "Tendency to follow market trends and momentum signals",
+        "Safety Focus": "Emphasis on stable, defensive investments with consistent returns",
+        "Volatility Tolerance": "Comfort level with market swings and portfolio fluctuations",
+        "Emotional Intensity": "Emotional charge of the language around investing decisions",
+        "Risk Tolerance": "Overall risk appetite combining growth, momentum, sentiment, and volatility comfort",
+    }
+    score_keys = (
+        "growth_focus", "momentum_bias", "safety_focus",
+        "volatility_tolerance", "emotional_intensity", "risk_tolerance",
+    )
+    st.dataframe(
+        {
+            "Score": list(score_rows),
+            "Value (0-1)": [f"{scores.get(key, 0):.2f}" for key in score_keys],
+            "Meaning": list(score_rows.values()),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    st.divider()
+
+    # Keyword mentions: one dataframe element instead of a st.text per row
+    st.subheader("🔤 Keyword Mentions")
+    mentions = profile.quantitative.mentions
+    st.dataframe(
+        {"Category": list(mentions), "Count": list(mentions.values())},
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    st.divider()
+
+    # Qualitative analysis (bound once instead of repeated attribute walks)
+    qualitative = profile.qualitative
+    if qualitative.narrative:
+        st.subheader("📝 Qualitative Analysis")
+        st.markdown(f"**Risk Tolerance:** {qualitative.risk_tolerance_label}")
+
+        if qualitative.traits:
+            st.markdown(f"**Traits:** {', '.join(qualitative.traits)}")
+
+        if qualitative.biases:
+            st.markdown(f"**Biases:** {', '.join(qualitative.biases)}")
+
+        st.markdown(f"**Narrative:**\n{qualitative.narrative}")
+
+    st.divider()
+
+    # Download options
+    st.subheader("📥 Download & Export")
+
+    col1, col2 = st.columns(2)
+
+    # Serialized once when the analysis ran; reruns reuse the stored copy
+    prof_dict = st.session_state["last_profile_dict"]
+
+    with col1:
+        # Deferred + compact: serialized only on click, without the
+        # pretty-print whitespace the on-disk copy already has
+        st.download_button(
+            label="📄 Download Full JSON Profile",
+            data=lambda: _json_payload(prof_dict),
+            file_name="behavioral_profile.json",
+            mime="application/json",
+            use_container_width=True,
+        )
+
+    with col2:
+        # Text corpus for manual LLM analysis; the callable defers the
+        # strict read until the button is clicked, and Streamlit
+        # surfaces any read error to the user at that point
+        st.download_button(
+            label="📝 Download Text Corpus (for ChatGPT/Gemini)",
+            data=lambda: _corpus_payload(input_dir),
+            file_name="analysis_corpus.txt",
+            mime="text/plain",
+            use_container_width=True,
+            help="Download all source text to paste into ChatGPT/Gemini for qualitative analysis"
+        )
+
+    # Show JSON preview as a plain code block: far cheaper for the
+    # frontend than st.json's collapsible per-node tree
+    with st.expander("🔍 View Raw JSON Output"):
+        st.code(st.session_state["last_profile_json"], language="json")
+
+    # Per-stage wall-clock times from the run that produced this profile
+    stage_timings = st.session_state.get("stage_timings")
+    if stage_timings:
+        with st.expander("⏱ Performance"):
+            st.dataframe(
+                {
+                    "Stage": list(stage_timings),
+                    "Seconds": [f"{seconds:.3f}" for seconds in stage_timings.values()],
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+
 
 st.set_page_config(
     page_title="Behavioral Risk Analysis",
@@ -48,42 +293,8 @@ with st.sidebar:
         )
         
         st.divider()
-        
-        st.markdown("""
-        **About LLM Analysis:**
-        
-        LLM (AI) analysis is disabled to avoid costs. For qualitative insights:
-        
-        1. Run the analysis to get quantitative metrics
-        2. Download the raw text corpus from the Results section
-        3. Copy the text and use ChatGPT/Gemini with this prompt:
-        
-        ```
-        Analyze this investment psychology corpus and provide:
-        
-        1. Risk Tolerance Label: [Conservative/Moderately Conservative/Moderate/Moderately Aggressive/Aggressive]
-        2. Personality Traits: [list 3-5 traits]
-        3. Behavioral Biases: [list 2-4 biases]
-        4. Narrative: [2-3 paragraph analysis]
-        5. Portfolio Recommendations: [sectors, allocation advice]
-        
-        Format response as JSON matching this structure:
-        {
-          "risk_tolerance_label": "...",
-          "traits": [...],
-          "biases": [...],
-          "narrative": "...",
-          "recommendations": {
-            "portfolio_modifier": "...",
-            "sector_pref": [...],
-            "notes": "..."
-          }
-        }
-        ```
-        
-        4. Paste the LLM's JSON response into `output/llm_qualitative.json`
-        5. Re-run analysis to merge results
-        """)
+
+        _sidebar_help()
 
 # Main content
 col1, col2 = st.columns(2)
@@ -92,13 +303,12 @@ with col1:
     st.subheader("📁 Input Files")
     
     # Show available input files
-    input_path = Path(input_dir)
-    if input_path.exists():
-        txt_files = list(input_path.glob("*.txt"))
+    if Path(input_dir).exists():
+        txt_files = _list_txt_files(input_dir)
         if txt_files:
             st.success(f"Found {len(txt_files)} file(s):")
-            for f in txt_files:
-                st.text(f"  • {f.name}")
+            for name in txt_files:
+                st.text(f"  • {name}")
         else:
             st.warning(f"No .txt files found in {input_dir}")
     else:
@@ -113,145 +323,45 @@ with col2:
 st.divider()
 
 if st.button("🚀 Run Analysis", use_container_width=True, type="primary"):
-    with st.spinner("Running analysis..."):
-        try:
-            profile = run_analysis(
-                input_dir=input_dir,
-                output_file=output_file,
-                llm_enabled=llm_enabled,
-            )
-            
-            st.success("✅ Analysis complete!")
-            
-            # Display results
-            st.subheader("📊 Results Summary")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric(
-                    "Words Analyzed", 
-                    f"{profile.quantitative.word_count:,}",
-                    help="Total words processed from all input files"
-                )
-            with col2:
-                st.metric(
-                    "Sentiment Score", 
-                    f"{profile.quantitative.sentiment:.2f}",
-                    help="Overall sentiment: 0=negative, 0.5=neutral, 1=positive. Measures optimism vs pessimism in language."
+    sig = _corpus_signature(input_dir)
+    if sig and st.session_state.get("profile_sig") == sig and "profile" in st.session_state:
+        # Inputs unchanged since the stored run: skip the pipeline (and
+        # the spinner) entirely
+        st.success("✅ Analysis up to date — inputs unchanged.")
+    else:
+        with st.spinner("Running analysis..."):
+            try:
+                profile, stage_timings = _cached_run_analysis(
+                    sig,
+                    input_dir,
+                    output_file,
+                    llm_enabled,
                 )
-            with col3:
+                st.session_state["stage_timings"] = stage_timings
+
+                # Serialize once and persist: results survive reruns
+                # triggered by other widgets (expanders, downloads)
+                prof_dict = profile.to_dict()
+                st.session_state["profile"] = profile
+                st.session_state["profile_sig"] = sig
+                st.session_state["last_profile_dict"] = prof_dict
+                st.session_state["last_profile_json"] = json.dumps(prof_dict, indent=2)
+
+                # Shortened headline label, computed once rather than per rerun
                 risk_label = profile.qualitative.risk_tolerance_label
-                st.metric(
-                    "Risk Tolerance", 
-                    risk_label if len(risk_label) <= 20 else risk_label.replace("Moderately ", "Mod. "),
-                    help="Investment risk profile based on behavioral patterns: Conservative → Moderate → Aggressive"
-                )
-            
-            st.divider()
-            
-            # Detailed metrics
-            st.subheader("📈 Behavioral Scores")
-            scores = profile.quantitative.scores
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric(
-                    "Growth Focus", 
-                    f"{scores.get('growth_focus', 0):.2f}",
-                    help="Preference for high-growth opportunities and scaling businesses (0=low, 1=high)"
-                )
-                st.metric(
-                    "Momentum Bias", 
-                    f"{scores.get('momentum_bias', 0):.2f}",
-                    help="Tendency to follow market trends and momentum signals (0=contrarian, 1=trend-follower)"
-                )
-            with col2:
-                st.metric(
-                    "Safety Focus", 
-                    f"{scores.get('safety_focus', 0):.2f}",
-                    help="Emphasis on stable, defensive investments with consistent returns (0=low, 1=high)"
-                )
-                st.metric(
-                    "Volatility Tolerance", 
-                    f"{scores.get('volatility_tolerance', 0):.2f}",
-                    help="Comfort level with market swings and portfolio fluctuations (0=low tolerance, 1=high tolerance)"
+                st.session_state["risk_label_display"] = (
+                    risk_label if len(risk_label) <= 20
+                    else risk_label.replace("Moderately ", "Mod. ")
                 )
-            with col3:
-                st.metric(
-                    "Risk Tolerance", 
-                    f"{scores.get('risk_tolerance', 0):.2f}",
-                    help="Overall risk appetite: weighted combination of growth focus, momentum, sentiment, and volatility comfort"
-                )
-            
-            st.divider()
-            
-            # Keyword mentions
-            st.subheader("🔤 Keyword Mentions")
-            mentions = profile.quantitative.mentions
-            col1, col2 = st.columns(2)
-            with col1:
-                for cat, count in list(mentions.items())[:3]:
-                    st.text(f"{cat}: {count}")
-            with col2:
-                for cat, count in list(mentions.items())[3:]:
-                    st.text(f"{cat}: {count}")
-            
-            st.divider()
-            
-            # Qualitative analysis
-            if profile.qualitative.narrative:
-                st.subheader("📝 Qualitative Analysis")
-                st.markdown(f"**Risk Tolerance:** {profile.qualitative.risk_tolerance_label}")
-                
-                if profile.qualitative.traits:
-                    st.markdown(f"**Traits:** {', '.join(profile.qualitative.traits)}")
-                
-                if profile.qualitative.biases:
-                    st.markdown(f"**Biases:** {', '.join(profile.qualitative.biases)}")
-                
-                if profile.qualitative.narrative:
-                    st.markdown(f"**Narrative:**\n{profile.qualitative.narrative}")
-            
-            st.divider()
-            
-            # Download options
-            st.subheader("📥 Download & Export")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                json_str = json.dumps(profile.to_dict(), indent=2)
-                st.download_button(
-                    label="📄 Download Full JSON Profile",
-                    data=json_str,
-                    file_name="behavioral_profile.json",
-                    mime="application/json",
-                    use_container_width=True,
-                )
-            
-            with col2:
-                # Prepare text corpus for manual LLM analysis
-                try:
-                    from behavioral.utils import load_text_files
-                    corpus_text = load_text_files(input_dir)
-                    st.download_button(
-                        label="📝 Download Text Corpus (for ChatGPT/Gemini)",
-                        data=corpus_text,
-                        file_name="analysis_corpus.txt",
-                        mime="text/plain",
-                        use_container_width=True,
-                        help="Download all source text to paste into ChatGPT/Gemini for qualitative analysis"
-                    )
-                except:
-                    pass
-            
-            # Show JSON preview
-            with st.expander("🔍 View Raw JSON Output"):
-                st.json(profile.to_dict())
-        
-        except Exception as e:
-            st.error(f"❌ Analysis failed: {e}")
-            st.info("Check the input directory and ensure .txt files are present.")
+
+                st.success("✅ Analysis complete!")
+            except Exception as e:
+                st.error(f"❌ Analysis failed: {e}")
+                st.info("Check the input directory and ensure .txt files are present.")
+
+# Render from session state so results persist across reruns
+if st.session_state.get("profile") is not None:
+    render_results(st.session_state["profile"])
 
 # Footer
 st.divider()